@@ -28,7 +28,9 @@ One can call internal command with the following:
 
         .. function:: argument_parser() -> ArgumentParser:
 
-            Returns the Python's :py:type:`argparse.ArgumentParser` for the given internal command
+            Returns the Python's :py:type:`argparse.ArgumentParser` for the given internal command.
+            The parser is built once and cached (:py:func:`functools.lru_cache`), thus it must
+            not be modified by callers.
 
         .. function:: run(argv: T.List[str]) -> None:
 
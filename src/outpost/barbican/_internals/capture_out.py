@@ -9,6 +9,7 @@ Execute a random command and capture stdout to file
 
 
 from argparse import ArgumentParser, REMAINDER
+from functools import lru_cache
 from pathlib import Path
 import typing as T
 import subprocess
@@ -20,6 +21,7 @@ def run_capture_stdout(cmdline: list[str], output: Path) -> None:
         fout.write(proc_return.stdout.decode("utf-8"))
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("out", type=Path, help="output filename")
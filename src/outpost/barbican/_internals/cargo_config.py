@@ -8,34 +8,44 @@ Add target specific and per apps compile flags in a config.
 """
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 import typing as T
 
 
 def run_cargo_config(rustargs: Path, target: Path, extra_args: str, outdir: Path) -> None:
-    rust_target = target.read_text().splitlines()[0]
-    rust_flags = rustargs.read_text().splitlines()
-    rust_flags.extend(extra_args.split(" "))
-    linker_args = list(filter(lambda x: x.startswith("-Clinker"), rust_flags))
-    linker = linker_args[0].split("=")[1] if len(linker_args) else "is not set"
-    rust_flags = list(filter(lambda x: not x.startswith("-Clinker"), rust_flags))
+    with target.open() as f:
+        rust_target = f.readline().rstrip("\n")
+    with rustargs.open() as f:
+        rust_flags = [line.rstrip("\n") for line in f]
+    rust_flags.extend(extra_args.split())
+    linker_args: list[str] = []
+    other_flags: list[str] = []
+    for flag in rust_flags:
+        (linker_args if flag.startswith("-Clinker") else other_flags).append(flag)
+    linker = linker_args[0].split("=", 1)[1] if linker_args else "is not set"
+    rust_flags = other_flags
+    outdir = outdir.resolve()
 
     config = f"""
 [build]
 target = "{rust_target}"
-target-dir = "{str(outdir.resolve())}"
+target-dir = "{str(outdir)}"
 rustflags = {rust_flags}
 
 [target.{rust_target}]
 {"#" if not len(linker_args) else ""}linker = "{linker}"
 
 [env]
-OUT_DIR = "{str(outdir.resolve())}"
+OUT_DIR = "{str(outdir)}"
 """
 
-    (outdir / ".cargo" / "config.toml").write_text(config)
+    config_dir = outdir / ".cargo"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "config.toml").write_text(config)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("--rustargs-file", type=Path, help="rustargs file path")
@@ -8,14 +8,17 @@ Add target specific and per apps compile flags in a config.
 """
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 import typing as T
 
 from .install import run_install, argument_parser as install_argument_parser
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
-    parser = install_argument_parser()
+    # install parser is a cached instance, extend it through parents instead of in place
+    parser = ArgumentParser(parents=[install_argument_parser()], add_help=False)
     parser.add_argument(
         "--target-file",
         type=Path,
@@ -34,6 +37,7 @@ def argument_parser() -> ArgumentParser:
 
 def run(argv: T.List[str]) -> None:
     args = argument_parser().parse_args(argv)
-    target: str = args.target_file.read_text().splitlines()[0]
+    with args.target_file.open() as f:
+        target: str = f.readline().rstrip("\n")
     from_dir: Path = (args.from_dir / target / args.profile).resolve(strict=True)
     run_install(from_dir, args.files, args.suffix)
@@ -8,11 +8,52 @@ TODO : documentation
 """
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 import typing as T
 
-from jinja2 import Environment, BaseLoader
-import json
+from jinja2 import Environment, BaseLoader, Template
+import orjson
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template: Path, mtime: float) -> Template:
+    """Return the compiled Jinja2 template for a given template file.
+
+    Compiled templates are cached and keyed on path and modification time, so that
+    a given template is compiled only once per process unless modified.
+    """
+    return Environment(loader=BaseLoader()).from_string(template.read_text())
+
+
+def run_gen_ldscripts(template: Path, layout: Path, ldscripts: T.List[T.Tuple[str, Path]]) -> None:
+    """LD scripts generator internal command.
+
+    Generate a set of application linker scripts sharing the same template and memory layout.
+    The memory layout is loaded and the template compiled once for all the linker scripts.
+
+    Parameters
+    ----------
+    template: Path
+        linker script Jinja2 template
+    layout: Path
+        barbican memory layout in json
+    ldscripts: T.List[T.Tuple[str, Path]]
+        list of (application name, generated linker script) to generate
+
+    See Also
+    --------
+    run_gen_ldscript
+    """
+    with open(layout, "rb") as layout_file:
+        memory_layout = orjson.loads(layout_file.read())
+
+    linkerscript_template = _compile_template(template, template.stat().st_mtime)
+    for name, output in ldscripts:
+        with open(output, "w", encoding="utf-8") as linkerscript:
+            linkerscript.write(
+                linkerscript_template.render(name=name, layout=memory_layout["regions"])
+            )
 
 
 def run_gen_ldscript(name: str, template: Path, layout: Path, output: Path) -> None:
@@ -34,29 +75,30 @@ def run_gen_ldscript(name: str, template: Path, layout: Path, output: Path) -> N
     output: Path
         generated linker script for a given application
     """
-    with open(layout, "r", encoding="utf-8") as layout_file:
-        memory_layout = json.load(layout_file)
-        with open(template, "r") as template_file:
-            linkerscript_template = Environment(loader=BaseLoader()).from_string(
-                template_file.read()
-            )
-            with open(output, "w", encoding="utf-8") as linkerscript:
-                linkerscript.write(
-                    linkerscript_template.render(name=name, layout=memory_layout["regions"])
-                )
+    run_gen_ldscripts(template, layout, [(name, output)])
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
-    parser.add_argument("--name", type=str, action="store", help="application name")
+    parser.add_argument(
+        "--name",
+        type=str,
+        action="append",
+        required=True,
+        help="application name, repeat for each output (in the same order)",
+    )
     parser.add_argument("template", type=Path, help="ld script template")
     parser.add_argument("layout", type=Path, help="memory layout (in json format)")
-    parser.add_argument("output", type=Path, help="output filename")
+    parser.add_argument("output", type=Path, nargs="+", help="output filename(s)")
 
     return parser
 
 
 def run(argv: T.List[str]) -> None:
     """Execute gen_ldscript internal command."""
-    args = argument_parser().parse_args(argv)
-    run_gen_ldscript(args.name, args.template, args.layout, args.output)
+    parser = argument_parser()
+    args = parser.parse_args(argv)
+    if len(args.name) != len(args.output):
+        parser.error("the number of --name and output filenames must match")
+    run_gen_ldscripts(args.template, args.layout, list(zip(args.name, args.output)))
@@ -8,6 +8,7 @@ This internal command forge firmware memory layout for barbican applications.
 """
 
 from argparse import ArgumentParser
+from functools import lru_cache
 import os
 from pathlib import Path
 import typing as T
@@ -19,20 +20,41 @@ from ..utils import memory_layout as memory
 from ..utils import align_to, pow2_round_up
 
 
-def _get_project_elves(exelist: list[Path]) -> T.Tuple[SentryElf, T.List[AppElf]]:
-    sentry: SentryElf
-    apps: T.List[AppElf] = []
+# Special elves in project executable list (by stem), any other elf is an application.
+# Idle and Autotest are placed in memory at kernel build time, those are skipped.
+_PROJECT_ELF_KIND: T.Final[dict[str, str]] = {
+    "sentry-kernel": "kernel",
+    "idle": "skip",
+    "autotest": "skip",
+}
+
+
+class _AppInfo(T.NamedTuple):
+    """Application elf information needed for memory placement."""
+
+    name: str
+    flash_size: int
+    ram_size: int
+
+
+def _get_app_info(elf: str) -> _AppInfo:
+    """Parse an application elf and return its memory placement information."""
+    app = AppElf(elf, None)
+    return _AppInfo(app.name, app.flash_size, app.ram_size)
+
+
+def _get_project_elves(exelist: list[Path]) -> T.Tuple[SentryElf, T.List[_AppInfo]]:
+    sentry_path: Path
+    app_paths: T.List[str] = []
 
     for elf in exelist:
-        name = elf.stem
-        if name == "sentry-kernel":
-            sentry = SentryElf(str(elf), None)
-        elif name == "idle" or name == "autotest":
-            continue
-        else:
-            apps.append(AppElf(str(elf), None))
+        kind = _PROJECT_ELF_KIND.get(elf.stem, "app")
+        if kind == "app":
+            app_paths.append(str(elf))
+        elif kind == "kernel":
+            sentry_path = elf
 
-    return sentry, apps
+    return SentryElf(str(sentry_path), None), [_get_app_info(elf) for elf in app_paths]
 
 
 def _add_kernel_regions(layout: memory.Layout, sentry: SentryElf) -> None:
@@ -133,10 +155,8 @@ def _arm_pmsa_v8_align_region(saddr: int, size: int) -> tuple[int, int]:
 
 def _add_app_regions(
     layout: memory.Layout,
-    app: AppElf,
+    app: _AppInfo,
     memory_slot: tuple[int, int],
-    code_limit: int,
-    ram_limit: int,
     region_fixup: T.Callable,
 ) -> tuple[int, int]:
     task_text, task_ram = memory_slot
@@ -144,13 +164,6 @@ def _add_app_regions(
     flash_saddr, flash_size = region_fixup(task_text, app.flash_size)
     ram_saddr, ram_size = region_fixup(task_ram, app.ram_size)
 
-    # XXX: dedicated error
-    if flash_saddr + flash_size >= code_limit:
-        raise Exception("task code region overflow")
-
-    if ram_saddr + ram_size >= ram_limit:
-        raise Exception("ram code region overflow")
-
     # trim extension
     name, _ = app.name.split(".", maxsplit=1)
 
@@ -240,9 +253,18 @@ def run_gen_memory_layout(output: Path, dts_filename: Path, exelist: list[Path])
     ram_limit = tasks_ram.reg[0] + tasks_ram.reg[1]
 
     for app in apps:
-        next_memory_slot = _add_app_regions(
-            layout, app, next_memory_slot, code_limit, ram_limit, _mpu_memory_region_fixup
-        )
+        next_memory_slot = _add_app_regions(layout, app, next_memory_slot, _mpu_memory_region_fixup)
+
+    # Applications are placed at increasing addresses, thus checking the end of the
+    # last memory slot is sufficient.
+    task_text_end, task_ram_end = next_memory_slot
+
+    # XXX: dedicated error
+    if task_text_end >= code_limit:
+        raise Exception("task code region overflow")
+
+    if task_ram_end >= ram_limit:
+        raise Exception("ram code region overflow")
 
     layout.save(output)
 
@@ -269,6 +291,7 @@ def run_gen_dummy_memory_layout(output: Path) -> None:
     layout.save(output)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("output", type=Path, help="output filename")
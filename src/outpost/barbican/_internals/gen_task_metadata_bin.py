@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from argparse import ArgumentParser
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -83,6 +84,7 @@ def run_gen_task_metadata_bin(input: Path, output: Path, path: ProjectPath) -> N
     _gen_metadata(output, {"task_meta": task_metadata}, path)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("output", type=Path, help="output elf file")
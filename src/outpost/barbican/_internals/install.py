@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from argparse import ArgumentParser, REMAINDER
+from functools import lru_cache
 from pathlib import Path
 import shutil
 import typing as T
@@ -20,6 +21,7 @@ def run_install(from_dir: Path, files: list[Path], suffix: str = ""):
         shutil.copy2(src, dest)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument(
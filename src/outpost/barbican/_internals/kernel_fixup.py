@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 import typing as T
 
@@ -27,6 +28,7 @@ def run_kernel_fixup(kern_input: Path, kern_output: Path, metadata: list[Path])
     kernel.save()
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("kern_output", type=Path, help="fixed up kernel elf file")
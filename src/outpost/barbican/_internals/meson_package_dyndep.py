@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from argparse import ArgumentParser
+from functools import lru_cache
 import json
 from pathlib import Path
 import subprocess
@@ -129,6 +130,7 @@ def run_meson_package_dyndep(
         out.write(json.dumps(package_introspection, indent=4))
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("--name", type=str, action="store", help="package name")
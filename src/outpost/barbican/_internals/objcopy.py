@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from argparse import ArgumentParser
+from functools import lru_cache
 import json
 from pathlib import Path
 import subprocess
@@ -29,6 +30,7 @@ def run_objcopy(objcopy: str, input: Path, output: Path, bfdname: str) -> None:
     subprocess.run(cmdline, check=True)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("output", type=Path, help="output file")
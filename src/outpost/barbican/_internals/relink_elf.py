@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from argparse import ArgumentParser
+from functools import lru_cache
 import json
 from pathlib import Path
 import subprocess
@@ -39,6 +40,7 @@ def run_relink_elf(
     subprocess.run(linker_cmdline, check=True)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument("output", type=Path, help="output elf file")
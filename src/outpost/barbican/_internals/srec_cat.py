@@ -8,6 +8,7 @@ TODO : documentation
 """
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 import typing as T
 
@@ -32,6 +33,7 @@ def run_srec_cat(inputs: T.List[Path], output: Path, format: str) -> None:
     subprocess.run(cmdline, check=True)
 
 
+@lru_cache(maxsize=1)
 def argument_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument(
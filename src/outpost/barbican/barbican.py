@@ -11,6 +11,8 @@ except ModuleNotFoundError:
     import tomli as tomllib
 
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 import logging
 import pathlib
@@ -31,6 +33,10 @@ from .buildsys import ninja_backend
 from .utils import pathhelper, working_directory
 
 
+# Maximum number of packages downloaded/updated concurrently
+_MAX_SCM_JOBS: T.Final[int] = 8
+
+
 class Project:
     def __init__(self, project_dir: pathlib.Path) -> None:
         self.path = pathhelper.ProjectPath(
@@ -81,28 +87,38 @@ class Project:
     def name(self) -> str:
         return self._toml["name"]
 
+    @property
+    def _scm_jobs(self) -> int:
+        """Number of concurrent package download/update jobs."""
+        return max(1, min(_MAX_SCM_JOBS, len(self._packages)))
+
     def download(self) -> None:
         logger.info("Downloading packages")
-        for p in self._packages:
-            p.download()
+        # Packages download is network bound and each package is independent.
+        with ThreadPoolExecutor(max_workers=self._scm_jobs) as executor:
+            list(executor.map(lambda p: p.download(), self._packages))
 
     def update(self) -> None:
         logger.info("Updating packages")
-        for p in self._packages:
-            p.update()
+        with ThreadPoolExecutor(max_workers=self._scm_jobs) as executor:
+            list(executor.map(lambda p: p.update(), self._packages))
 
     def setup(self) -> None:
+        # ProjectPath members are already Path objects, bind the ones used below once
+        build_dir = self.path.build_dir
+        private_build_dir = self.path.private_build_dir
+        project_dir = self.path.project_dir
+        sysroot_data_dir = self.path.sysroot_data_dir
+        dts = pathlib.Path(self._toml["dts"])
 
         logger.info("Create Cargo local repository")
-        registry = cargo.LocalRegistry(
-            self.path.sysroot_data_dir / "cargo" / "registry" / "outpost_sdk"
-        )
+        registry = cargo.LocalRegistry(sysroot_data_dir / "cargo" / "registry" / "outpost_sdk")
         cargo_config = cargo.Config(self.path.output_dir, registry)
         registry.init()
         self._kernel.install_crates(registry, cargo_config)
         self._runtime.install_crates(registry, cargo_config)
         logger.info(f"Generating {self.name} Ninja build File")
-        ninja = ninja_backend.NinjaGenFile(os.path.join(self.path.build_dir, "build.ninja"))
+        ninja = ninja_backend.NinjaGenFile(build_dir / "build.ninja")
 
         ninja.add_barbican_rules()
         ninja.add_barbican_internals_rules()
@@ -112,10 +128,7 @@ class Project:
         for p in self._packages:
             dts_include_dirs.extend(p.dts_include_dirs)
 
-        ninja.add_barbican_dts(
-            (pathlib.Path(self.path.project_dir) / self._toml["dts"]).resolve(strict=True),
-            dts_include_dirs,
-        )
+        ninja.add_barbican_dts((project_dir / dts).resolve(strict=True), dts_include_dirs)
 
         ninja.add_meson_rules()
         ninja.add_cargo_rules(self._kernel.rustargs, self._kernel.rust_target)
@@ -133,16 +146,14 @@ class Project:
 
         # Dummy layout for dummy link
         dummy_layout = ninja.add_internal_gen_dummy_memory_layout_target(
-            output=pathlib.Path(self.path.private_build_dir, "dummy_layout.json"),
+            output=private_build_dir / "dummy_layout.json",
         )
 
         # linkerscript template file
         # XXX: hardcoded in early steps
-        linker_script_template = (
-            pathlib.Path(self.path.sysroot_data_dir) / "shield" / "linkerscript.ld.in"
-        )
+        linker_script_template = sysroot_data_dir / "shield" / "linkerscript.ld.in"
 
-        dummy_linker_script = pathlib.Path(self.path.private_build_dir, "dummy.lds")
+        dummy_linker_script = private_build_dir / "dummy.lds"
         ninja.add_gen_ldscript_target(
             "dummy", dummy_linker_script, linker_script_template, pathlib.Path(dummy_layout[0])
         )
@@ -168,17 +179,18 @@ class Project:
                 layout_app_exelist.extend(package.dummy_linked_targets)
 
         firmware_layout = ninja.add_internal_gen_memory_layout_target(
-            output=pathlib.Path(self.path.private_build_dir, "layout.json"),
-            dts=pathlib.Path(
-                self.path.sysroot_data_dir, f"{pathlib.Path(self._toml['dts']).name}.pp"
-            ),
+            output=private_build_dir / "layout.json",
+            dts=sysroot_data_dir / f"{dts.name}.pp",
             dependencies=self._packages,
             sys_exelist=layout_sys_exelist,
             app_exelist=layout_app_exelist,
         )
 
+        firmware_layout_path = pathlib.Path(firmware_layout[0])
         app_metadata = []
         app_hex_files = []
+        app_ldscripts = []
+        app_package_names = []
 
         # gen_ld/relink/gen_meta/objcopy app(s)
         for package in self._packages:
@@ -186,39 +198,37 @@ class Project:
                 # XXX: Handle multiple exe package
                 elf_in = package.installed_targets[0]
                 elf_out = package.relocated_targets[0]
-                linker_script = pathlib.Path(self.path.private_build_dir, f"{elf_in.stem}.lds")
+                linker_script = private_build_dir / f"{elf_in.stem}.lds"
                 metadata_out = elf_out.with_suffix(".meta")
                 hex_out = elf_out.with_suffix(".hex")
+                package_name = package.name if package.backend == Backend.Meson else "kernel"
+
+                app_ldscripts.append((elf_in.stem, linker_script))
+                app_package_names.append(package.name)
 
-                ninja.add_gen_ldscript_target(
-                    elf_in.stem,
-                    linker_script,
-                    linker_script_template,
-                    pathlib.Path(firmware_layout[0]),
-                    package.name,
-                )
                 ninja.add_relink_target(
                     package.name,
                     elf_in,
                     elf_out,
                     linker_script,
-                    package_name=package.name if package.backend == Backend.Meson else "kernel",
+                    package_name=package_name,
                 )
 
-                ninja.add_objcopy_rule(
-                    elf_out,
-                    hex_out,
-                    "ihex",
-                    [],
-                    package_name=package.name if package.backend == Backend.Meson else "kernel",
-                )
+                ninja.add_objcopy_rule(elf_out, hex_out, "ihex", [], package_name=package_name)
                 app_hex_files.append(hex_out)
 
-                ninja.add_gen_metadata_rule(
-                    elf_out, metadata_out, pathlib.Path(self.path.project_dir)
-                )
+                ninja.add_gen_metadata_rule(elf_out, metadata_out, project_dir)
                 app_metadata.append(metadata_out)
 
+        # An empty application table is valid, do not emit an edge without output
+        if app_ldscripts:
+            ninja.add_gen_ldscripts_target(
+                app_ldscripts,
+                linker_script_template,
+                firmware_layout_path,
+                app_package_names,
+            )
+
         # Patch kernel/objcopy
         kernel_elf = self._packages[0].installed_targets[1]
         kernel_patched_elf = self._packages[0].relocated_targets[1]
@@ -237,7 +247,7 @@ class Project:
         # ninja.add_objcopy_rule(idle_elf, idle_hex, "ihex", None, self._packages[0].name)
 
         # srec_cat
-        firmware_hex = pathlib.Path(self.path.build_dir) / "firmware.hex"
+        firmware_hex = build_dir / "firmware.hex"
         ninja.add_srec_cat_rule(kernel_hex, idle_hex, app_hex_files, firmware_hex)
 
         ninja.close()
@@ -256,6 +266,7 @@ def setup(project: Project) -> None:
         project.setup()
 
 
+@lru_cache(maxsize=1)
 def common_argument_parser() -> ArgumentParser:
     """Argument parser for logging infrastrucutre."""
     common_parser = ArgumentParser(add_help=False)
@@ -277,6 +288,7 @@ def common_argument_parser() -> ArgumentParser:
     return common_parser
 
 
+@lru_cache(maxsize=1)
 def main_argument_parser() -> ArgumentParser:
     """Argument parser for main entrypoint."""
     parser = ArgumentParser(prog="barbican", add_help=True)
@@ -40,13 +40,16 @@ class NinjaGenFile:
         )
 
     def add_barbican_internals_rules(self) -> None:
+        # XXX:
+        #  Internal commands are not bound to the console pool (depth 1), per application
+        #  steps (ld script, relink, objcopy, metadata) are independent and can be scheduled
+        #  in parallel by ninja.
         def _add_barbican_internal_rule(name: str, args: str) -> None:
             self._ninja.newline()
             self._ninja.rule(
                 f"{name}",
                 description=f"barbican internal {name} command",
                 command=f"$barbican --internal {name} {args}",
-                pool="console",
             )
 
         internal_commands = {
@@ -70,7 +73,6 @@ class NinjaGenFile:
             "internal",
             description="barbican internal command",
             command="$barbican --internal $cmd $args",
-            pool="console",
         )
 
     def add_barbican_targets(self, project: "Project") -> None:
@@ -137,11 +139,12 @@ class NinjaGenFile:
         output: Path,
         template: Path,
         layout: Path,
-        package_name: Optional[str] = None,
     ) -> None:
+        """Generate a standalone linker script (e.g. dummy), depending on runtime only.
+
+        Application linker scripts are generated by :py:meth:`add_gen_ldscripts_target`.
+        """
         implicit_inputs = ["runtime_install.stamp"]
-        if name != "dummy":
-            implicit_inputs.append(f"{package_name if package_name else name}_install.stamp")
         self._ninja.newline()
 
         self._ninja.build(
@@ -156,6 +159,32 @@ class NinjaGenFile:
             },
         )
 
+    def add_gen_ldscripts_target(
+        self,
+        ldscripts: list[tuple[str, Path]],
+        template: Path,
+        layout: Path,
+        package_names: list[str],
+    ) -> None:
+        """Generate a set of linker scripts from the same template and layout in one command."""
+        implicit_inputs = ["runtime_install.stamp"]
+        implicit_inputs.extend([f"{package_name}_install.stamp" for package_name in package_names])
+        names_opt = " ".join(f"--name {name}" for name, _ in ldscripts)
+        outputs = [str(output) for _, output in ldscripts]
+        self._ninja.newline()
+
+        self._ninja.build(
+            outputs=[str(output.resolve()) for _, output in ldscripts],
+            rule="internal",
+            inputs=str(layout.resolve()),
+            implicit=implicit_inputs,
+            variables={
+                "cmd": "gen_ldscript",
+                "args": f"{names_opt} {str(template)} {str(layout)} {' '.join(outputs)}",
+                "description": "generating applications linker scripts",
+            },
+        )
+
     def add_relink_target(
         self,
         name: str,
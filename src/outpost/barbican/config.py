@@ -2,226 +2,155 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import json
-
-from referencing import Registry, Resource
-from jsonschema import Draft202012Validator
+from functools import lru_cache
 
 import typing as T
 
+if T.TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
 
-_SCM_GIT_SCHEMA = json.loads(
-    """
-{
+
+_SCM_GIT_SCHEMA = {
     "$id": "urn:barbican:scm:git",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
-    "properties": {
-        "uri": {
-            "type": "string",
-            "format": "uri"
-        },
-        "revision": { "type": "string" }
-    },
-    "required": [ "uri", "revision"],
-    "additionalProperties": false
+    "properties": {"uri": {"type": "string", "format": "uri"}, "revision": {"type": "string"}},
+    "required": ["uri", "revision"],
+    "additionalProperties": False,
 }
-"""
-)
 
 
-_SCM_SCHEMA = json.loads(
-    """
-{
+_SCM_SCHEMA = {
     "$id": "urn:barbican:scm",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
     "oneOf": [
         {
-            "properties": {
-                "git": {
-                    "$ref": "urn:barbican:scm:git"
-                }
-            },
+            "properties": {"git": {"$ref": "urn:barbican:scm:git"}},
             "required": ["git"],
-            "additionalProperties": false
+            "additionalProperties": False,
         }
-    ]
+    ],
 }
-"""
-)
 
 
-_KERNEL_SCHEMA = json.loads(
-    """
-{
+_KERNEL_SCHEMA = {
     "$id": "urn:barbican:kernel",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
     "properties": {
-        "scm": { "$ref": "urn:barbican:scm" },
-        "config": { "type": "string" },
+        "scm": {"$ref": "urn:barbican:scm"},
+        "config": {"type": "string"},
         "build": {
             "type": "object",
-            "properties": {
-                "options": { "$ref": "urn:barbican:build#/properties/options" }
-            },
-            "required": [ "options" ]
-        }
+            "properties": {"options": {"$ref": "urn:barbican:build#/properties/options"}},
+            "required": ["options"],
+        },
     },
-    "required": [ "scm", "config" ],
-    "additionalProperties": false
+    "required": ["scm", "config"],
+    "additionalProperties": False,
 }
-"""
-)
 
 
-_RUNTIME_SCHEMA = json.loads(
-    """
-{
+_RUNTIME_SCHEMA = {
     "$id": "urn:barbican:runtime",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
     "properties": {
-        "scm": { "$ref": "urn:barbican:scm" },
-        "config": { "type": "string" },
+        "scm": {"$ref": "urn:barbican:scm"},
+        "config": {"type": "string"},
         "build": {
             "type": "object",
-            "properties": {
-                "options": { "$ref": "urn:barbican:build#/properties/options" }
-            },
-            "required": [ "options" ]
-        }
+            "properties": {"options": {"$ref": "urn:barbican:build#/properties/options"}},
+            "required": ["options"],
+        },
     },
-    "required": [ "scm", "config" ],
-    "additionalProperties": false
+    "required": ["scm", "config"],
+    "additionalProperties": False,
 }
-"""
-)
 
 
-_BUILD_SCHEMA = json.loads(
-    """
-{
+_BUILD_SCHEMA = {
     "$id": "urn:barbican:build",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
     "properties": {
-        "backend": {
-            "type": "string",
-            "enum": ["meson", "cargo"]
-        },
+        "backend": {"type": "string", "enum": ["meson", "cargo"]},
         "options": {
             "type": "object",
-            "properties": {
-                "static_pie": { "type": "boolean" }
-            },
+            "properties": {"static_pie": {"type": "boolean"}},
             "additionalProperties": {
-                "oneOf": [
-                    { "type": "string" },
-                    { "type": "boolean" },
-                    { "type": "integer" }
-                ]
-            }
-        }
+                "oneOf": [{"type": "string"}, {"type": "boolean"}, {"type": "integer"}]
+            },
+        },
     },
-    "required": [ "backend" ],
-    "additionalProperties": false
+    "required": ["backend"],
+    "additionalProperties": False,
 }
-"""
-)
 
 
-_APPLICATION_SCHEMA = json.loads(
-    """
-{
+_APPLICATION_SCHEMA = {
     "$id": "urn:barbican:application",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
     "properties": {
-        "scm": { "$ref": "urn:barbican:scm" },
-        "config": { "type": "string" },
-        "build": { "$ref": "urn:barbican:build" },
-        "depends": {
-            "type": "array",
-            "items": { "type": "string" }
-        },
-        "provides": {
-            "type": "array",
-            "items": { "type": "string" }
-        }
+        "scm": {"$ref": "urn:barbican:scm"},
+        "config": {"type": "string"},
+        "build": {"$ref": "urn:barbican:build"},
+        "depends": {"type": "array", "items": {"type": "string"}},
+        "provides": {"type": "array", "items": {"type": "string"}},
     },
-    "required": [ "scm", "build", "provides" ],
-    "additionalProperties": false
+    "required": ["scm", "build", "provides"],
+    "additionalProperties": False,
 }
-"""
-)
 
 
 # TODO:
 #  - Add License validator
 
-_PROJECT_SCHEMA = json.loads(
-    """
-{
+_PROJECT_SCHEMA = {
     "$id": "urn:barbican:project",
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "title": "barbican project TOML configuration",
     "type": "object",
     "properties": {
-        "name": {
-            "type": "string",
-            "description": "Project Name"
-        },
-        "version": {
-            "type": "string"
-        },
+        "name": {"type": "string", "description": "Project Name"},
+        "version": {"type": "string"},
         "license": {
             "type": "string",
-            "description": "license identifier (must be a valid SPDX License Identifier)"
+            "description": "license identifier (must be a valid SPDX License Identifier)",
         },
         "license_file": {
             "type": "array",
-            "items": {
-                "type": "string"
-            },
-            "description": "license file name"
-        },
-        "dts": {
-            "type": "string",
-            "description": "DTS file"
-        },
-        "crossfile": {
-            "type": "string",
-            "description": "meson cross file for arch mcu"
-        },
-        "kernel": {
-            "$ref": "urn:barbican:kernel"
-        },
-        "runtime": {
-            "$ref": "urn:barbican:runtime"
+            "items": {"type": "string"},
+            "description": "license file name",
         },
+        "dts": {"type": "string", "description": "DTS file"},
+        "crossfile": {"type": "string", "description": "meson cross file for arch mcu"},
+        "kernel": {"$ref": "urn:barbican:kernel"},
+        "runtime": {"$ref": "urn:barbican:runtime"},
         "application": {
-            "patternProperties": {
-                ".*": {
-                    "type": "object",
-                    "$ref": "urn:barbican:application"
-                }
-            },
-            "additionalProperties": false
-        }
+            "patternProperties": {".*": {"type": "object", "$ref": "urn:barbican:application"}},
+            "additionalProperties": False,
+        },
     },
-    "required": [ "name", "dts", "kernel", "version", "version" ],
-    "dependentRequired": {
-        "license": ["license_file"],
-        "license_file": ["license"]
-    }
+    "required": ["name", "dts", "kernel", "version", "version"],
+    "dependentRequired": {"license": ["license_file"], "license_file": ["license"]},
 }
-"""
-)
 
 
-def validate(config: dict[str, T.Any]) -> None:
+@lru_cache(maxsize=1)
+def _get_validator() -> "Draft202012Validator":
+    """Return the project configuration validator.
+
+    Schemas registry and validator are built once and reused for subsequent validations.
+
+    .. note:: jsonschema and referencing are imported here, at first use, as those are not
+      required by barbican commands that do not validate a project configuration.
+    """
+    from referencing import Registry, Resource
+    from jsonschema import Draft202012Validator
+
     registry: Registry = Resource.from_contents(_APPLICATION_SCHEMA) @ Registry()
     registry = Resource.from_contents(_RUNTIME_SCHEMA) @ registry
     registry = Resource.from_contents(_KERNEL_SCHEMA) @ registry
@@ -230,8 +159,11 @@ def validate(config: dict[str, T.Any]) -> None:
     registry = Resource.from_contents(_BUILD_SCHEMA) @ registry
     registry = Resource.from_contents(_PROJECT_SCHEMA) @ registry
 
-    validator = Draft202012Validator(
+    return Draft202012Validator(
         _PROJECT_SCHEMA,
         registry=registry,
     )
-    validator.validate(config)
+
+
+def validate(config: dict[str, T.Any]) -> None:
+    _get_validator().validate(config)
@@ -5,18 +5,25 @@
 import json
 import shutil
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, BaseLoader
-
 from .package import Package
+from ..console import console
+from ..logger import logger
+from ..utils import working_directory
 from ..utils.environment import ExeWrapper, find_program
 
 
+@lru_cache(maxsize=None)
+def _cargo(capture_out: bool = False) -> ExeWrapper:
+    """Cargo program wrapper, shared by all users in the process."""
+    return ExeWrapper("cargo", capture_out=capture_out)
+
+
 class Metadata:
     def __init__(self, manifest_path: Path) -> None:
-        self._cargo = ExeWrapper("cargo", capture_out=True)
+        self._cargo = _cargo(capture_out=True)
         self._metadata = json.loads(
             self._cargo.metadata(
                 manifest_path=str(manifest_path.resolve(strict=True)),
@@ -36,25 +43,21 @@ class LocalRegistry:
         self._path = path
         # Check for cargo extension cargo-index (but wrapp call as cargo subcommand)
         find_program("cargo-index")
-        self._cargo = ExeWrapper("cargo")
+        self._cargo = _cargo()
 
     @property
-    @lru_cache
     def name(self) -> str:
         return self._path.name
 
     @property
-    @lru_cache
     def path(self) -> Path:
         return self._path
 
-    @property
-    @lru_cache
+    @cached_property
     def index(self) -> Path:
         return self._path / "index"
 
     @property
-    @lru_cache
     def exists(self) -> bool:
         return (self.index / ".cargo-index-lock").exists()
 
@@ -88,29 +91,6 @@ class LocalRegistry:
 
 
 class Config:
-
-    template: str = """
-[registries.{{ registry.name }}]
-index = "{{ registry.index.as_uri() }}"
-
-[source.{{ registry.name }}]
-registry = "{{ registry.index.as_uri() }}"
-replace-with = 'local-registry'
-
-[source.local-registry]
-local-registry = "{{ registry.path }}"
-
-[net]
-git-fetch-with-cli = true
-
-{% if crates|length != 0 %}
-[patch.crates-io]
-{%- for name, version in crates.items() %}
-{{ name }} = { version="{{ version }}", registry="{{ registry.name }}" }
-{%- endfor %}
-{% endif %}
-"""
-
     def __init__(self, builddir: Path, registry: LocalRegistry) -> None:
         self._base_path = builddir
         self._local_registry = registry
@@ -118,26 +98,79 @@ git-fetch-with-cli = true
         self.config_dir.mkdir(exist_ok=True)
         self._update()
 
-    @property
-    @lru_cache
+    @cached_property
     def config_dir(self) -> Path:
         return self._base_path / ".cargo"
 
-    @property
-    @lru_cache
+    @cached_property
     def config_filename(self) -> Path:
         return self.config_dir / "config.toml"
 
+    def _render(self) -> str:
+        registry = self._local_registry
+        index_uri = registry.index.as_uri()
+        lines = [
+            f"[registries.{registry.name}]",
+            f'index = "{index_uri}"',
+            "",
+            f"[source.{registry.name}]",
+            f'registry = "{index_uri}"',
+            "replace-with = 'local-registry'",
+            "",
+            "[source.local-registry]",
+            f'local-registry = "{registry.path}"',
+            "",
+            "[net]",
+            "git-fetch-with-cli = true",
+            "",
+        ]
+        if self._crates:
+            lines.append("[patch.crates-io]")
+            lines.extend(
+                f'{name} = {{ version="{version}", registry="{registry.name}" }}'
+                for name, version in self._crates.items()
+            )
+        return "\n".join(lines) + "\n"
+
     def _update(self) -> None:
-        template = Environment(loader=BaseLoader()).from_string(self.template)
-        with self.config_filename.open(mode="w", encoding="utf-8") as config:
-            config.write(template.render(registry=self._local_registry, crates=self._crates))
+        self.config_filename.write_text(self._render(), encoding="utf-8")
 
     def patch_crate_registry(self, name: str, version: str) -> None:
         self._crates[name] = version
         self._update()
 
 
+def deploy_crates(
+    manifests: dict[str, Path], registry: LocalRegistry, config: Config, target_dir: Path
+) -> None:
+    """Publish crates to local registry and patch cargo config accordingly.
+
+    Parameters
+    ----------
+    manifests: dict[str, Path]
+        Cargo manifest path, indexed by crate name.
+    registry: LocalRegistry
+        Local registry to publish to.
+    config: Config
+        Cargo config to patch, updated after each published crate.
+    target_dir: Path
+        Cargo target directory used for packaging.
+    """
+    with working_directory(target_dir):
+        for name, manifest in manifests.items():
+            manifest = manifest.resolve(strict=True)
+            console.message(f"Install [b]{name}[/b] ([i]{str(manifest)}[/i]) to local registry")
+            version = Metadata(manifest).package_version(name)
+            if not version:
+                logger.warning(f"{name} version not found, skip")
+                continue
+            registry.publish(name=name, version=version, manifest=manifest, target_dir=target_dir)
+            # XXX:
+            #  Patch config right away, next crates may depend on this one and cargo looks up
+            #  the config in parent directories while packaging them.
+            config.patch_crate_registry(name=name, version=version)
+
+
 class Cargo(Package):
     def __init__(self, name: str, parent_project, config_node: dict, type):
         super().__init__(name, parent_project, config_node, type)
@@ -153,8 +186,7 @@ class Cargo(Package):
         opts.append("-Clink-args=-Wl,-entry=_start")
         return opts
 
-    @property
-    @lru_cache
+    @cached_property
     def manifest(self) -> Path:
         return (self.src_dir / "Cargo.toml").resolve(strict=True)
 
@@ -2,16 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from functools import lru_cache
 from pathlib import Path
 
 from .package import Package
 from .meson import Meson
-from .cargo import LocalRegistry, Metadata, Config
-
-from ..console import console
-from ..logger import logger
-from ..utils import working_directory
+from .cargo import LocalRegistry, Config, deploy_crates
 
 
 class Kernel:
@@ -39,28 +34,12 @@ class Kernel:
 
     def install_crates(self, registry: LocalRegistry, cargo_config: Config) -> None:
         self._package.build_dir.mkdir(exist_ok=True)
-        with working_directory(self._package.build_dir):
-            for name, manifest in self._cargo_manifests.items():
-                console.message(f"Install [b]{name}[/b] ([i]{str(manifest)}[/i]) to local registry")
-                metadata = Metadata(manifest)
-                version = metadata.package_version(name)
-                if not version:
-                    logger.warning(f"{name} version not found, skip")
-                    continue
-                registry.publish(
-                    name=name,
-                    version=version,
-                    manifest=manifest,
-                    target_dir=self._package.build_dir,
-                )
-                cargo_config.patch_crate_registry(name=name, version=version)
+        deploy_crates(self._cargo_manifests, registry, cargo_config, self._package.build_dir)
 
     @property
-    @lru_cache
     def rustargs(self) -> Path:
         return self._rustargs
 
     @property
-    @lru_cache
     def rust_target(self) -> Path:
         return self._rust_target
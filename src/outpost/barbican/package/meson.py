@@ -5,7 +5,6 @@
 import subprocess
 
 from .package import Package
-from ..utils import working_directory_attr
 
 
 class Meson(Package):
@@ -21,11 +20,21 @@ class Meson(Package):
         opts.extend([f"-D{k}={str(v)}" for k, v in self._extra_build_opts.items()])
         return opts
 
-    @working_directory_attr("src_dir")
+    @property
+    def has_subprojects(self) -> bool:
+        """True if the package has wrap dependencies, i.e. subprojects to download."""
+        return any((self.src_dir / "subprojects").glob("*.wrap"))
+
     def post_download_hook(self):
-        subprocess.run(["meson", "subprojects", "download"], capture_output=True)
+        if not self.has_subprojects:
+            return
+        subprocess.run(["meson", "subprojects", "download"], capture_output=True, cwd=self.src_dir)
 
-    @working_directory_attr("src_dir")
     def post_update_hook(self):
-        subprocess.run(["meson", "subprojects", "download"], capture_output=True)
-        subprocess.run(["meson", "subprojects", "update"], capture_output=True)
+        if not self.has_subprojects:
+            return
+        # XXX:
+        #  `subprojects update` skips not yet downloaded subprojects (e.g. newly added wrap),
+        #  so download first.
+        subprocess.run(["meson", "subprojects", "download"], capture_output=True, cwd=self.src_dir)
+        subprocess.run(["meson", "subprojects", "update"], capture_output=True, cwd=self.src_dir)
@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 import collections.abc
 from pathlib import Path
 
-from functools import lru_cache
+from functools import cached_property
 from enum import auto, unique
 
 from ..console import console
@@ -144,38 +144,31 @@ class Package(ABC):
     def backend(self) -> Backend:
         return Backend(self.__class__.__name__.lower())
 
-    @property
-    @lru_cache
+    @cached_property
     def src_dir(self) -> Path:
         return self._parent.path.src_dir / self.name
 
-    @property
-    @lru_cache
+    @cached_property
     def build_dir(self) -> Path:
         return self._parent.path.build_dir / self.name
 
-    @property
-    @lru_cache
+    @cached_property
     def staging_dir(self) -> Path:
         return self._parent.path.staging_dir
 
-    @property
-    @lru_cache
+    @cached_property
     def pkgconfig_dir(self) -> Path:
         return self._parent.path.sysroot_pkgconfig_dir
 
-    @property
-    @lru_cache
+    @cached_property
     def bin_dir(self) -> Path:
         return self._parent.path.target_bin_dir
 
-    @property
-    @lru_cache
+    @cached_property
     def lib_dir(self) -> Path:
         return self._parent.path.sysroot_lib_dir
 
-    @property
-    @lru_cache
+    @cached_property
     def data_dir(self) -> Path:
         return self._parent.path.sysroot_data_dir / self.name.replace("lib", "", 1)
 
@@ -209,6 +202,10 @@ class Package(ABC):
     def parent(self):
         return self._parent
 
+    @property
+    def url(self) -> str:
+        return self._scm.url
+
     @property
     def deps(self):
         if self._type == Package.Type.Kernel:
@@ -231,20 +228,20 @@ class Package(ABC):
         self._scm.download()
 
         # TODO post download trigger in config
-        with console.status(f"Running {self.backend.name} post download hook"):
-            self.post_download_hook()
-        console.message("[b]Done.[/b]")
+        # XXX:
+        #  Packages may be downloaded concurrently, do not use a live status display here
+        #  (only one live display may be active at a time).
+        console.message(f"Running {self.name} {self.backend.name} post download hook")
+        self.post_download_hook()
+        console.message(f"[b]{self.name} Done.[/b]")
 
     def update(self) -> None:
         logger.info(f"Updating {self.name}")
         self._scm.update()
 
         # TODO post udpate trigger in config
-        with console.status(f"Running {self.backend.name} post update hook"):
-            self.post_update_hook()
-
-    def __getattr__(self, attr):
-        return self._config[attr] if attr in self._config else None
+        console.message(f"Running {self.name} {self.backend.name} post update hook")
+        self.post_update_hook()
 
     @property
     @abstractmethod
@@ -4,7 +4,10 @@
 
 from enum import auto, unique
 import collections.abc
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
+import typing as T
 from .scm import ScmBaseClass
 from ..utils import StrEnum
 
@@ -25,14 +28,13 @@ class ScmMethodFactoryMap(collections.abc.Mapping[ScmMethodEnum, collections.abc
         yield from [k.value for k in list(self._key_type)]
 
     def __getitem__(self, key):
-        method = self._key_type(key)
+        return self._get_scm_class(self._key_type(key))
 
-        from importlib import import_module
-        import sys
-
-        return getattr(
-            import_module("." + method.value, sys.modules[__name__].__name__), method.name
-        )
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_scm_class(method: ScmMethodEnum) -> T.Type[ScmBaseClass]:
+        """Import (once) and return the SCM class for the given method."""
+        return getattr(import_module("." + method.value, __name__), method.name)
 
 
 SCM_FACTORY_DICT = ScmMethodFactoryMap()
@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import re
+import threading
+
 from git import Repo, RemoteProgress, FetchInfo
 from git.exc import InvalidGitRepositoryError, NoSuchPathError
 
@@ -9,11 +12,21 @@ from ..logger import logger
 
 from .scm import ScmBaseClass
 
-from typing import Optional, cast
+from typing import ClassVar, Optional, cast
+
+import rich.progress
 
 from ..console import console
 
 
+# Full (i.e. 40 hex digits) git sha, same as `git.Repo.re_hexsha_only`
+_HEXSHA_RE = re.compile(r"^[0-9A-Fa-f]{40}$")
+
+# Blobless partial clone, blobs are fetched on demand (i.e. at checkout) and the filter
+# is recorded in the cloned repository config, thus subsequent fetches are blobless too.
+_CLONE_OPTIONS = ["--filter=blob:none"]
+
+
 class GitProgressBar(RemoteProgress):
     OP_CODES = [
         "BEGIN",
@@ -29,13 +42,30 @@ class GitProgressBar(RemoteProgress):
 
     OP_CODE_MAP = {getattr(RemoteProgress, _op_code): _op_code for _op_code in OP_CODES}
 
-    def __init__(self) -> None:
+    # XXX:
+    #  Only one live display can be active at a time on the console, git operations may run
+    #  concurrently (e.g. packages download), thus all GitProgressBar instances share the same
+    #  progress bar, which is stopped when the last instance is released.
+    _shared_progressbar: ClassVar[rich.progress.Progress | None] = None
+    _shared_count: ClassVar[int] = 0
+    _shared_lock: ClassVar[threading.RLock] = threading.RLock()
+
+    def __init__(self, name: str = "") -> None:
         super().__init__()
-        self._progressbar = console.progress_bar()
+        self._name = name
+        with GitProgressBar._shared_lock:
+            if GitProgressBar._shared_progressbar is None:
+                GitProgressBar._shared_progressbar = console.progress_bar()
+            GitProgressBar._shared_count += 1
+            self._progressbar = GitProgressBar._shared_progressbar
 
     def __del__(self) -> None:
-        if self._progressbar.live.is_started:
-            self._progressbar.stop()
+        with GitProgressBar._shared_lock:
+            GitProgressBar._shared_count -= 1
+            if GitProgressBar._shared_count == 0:
+                if self._progressbar.live.is_started:
+                    self._progressbar.stop()
+                GitProgressBar._shared_progressbar = None
 
     @classmethod
     def get_curr_op(cls, op_code: int) -> str:
@@ -52,13 +82,12 @@ class GitProgressBar(RemoteProgress):
     ) -> None:
         # Start new bar on each BEGIN-flag
         if op_code & self.BEGIN:
-            # Start rendering at first task insertion
-            if not self._progressbar.live.is_started:
-                self._progressbar.start()
+            # Start rendering at first task insertion (no-op if already started)
+            self._progressbar.start()
 
             self.curr_op = self.get_curr_op(op_code)
             self._active_task = self._progressbar.add_task(
-                description=self.curr_op,
+                description=f"{self._name}: {self.curr_op}" if self._name else self.curr_op,
                 total=cast(Optional[float], max_count),
                 message=message,
             )
@@ -82,11 +111,20 @@ class Git(ScmBaseClass):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._repo: Repo
+        # Known valid object sha, objects are never removed from repository during a run
+        self._valid_sha_cache: set[str] = set()
+        # Cheap check before opening the repository, which is costly (and raises) if not cloned yet.
+        # Note: `.git` may be a regular file (e.g. worktree or submodule)
+        if not (self.sourcedir / ".git").exists():
+            if self.sourcedir.exists():
+                logger.warning(f"{self.name} not a git repository")
+            else:
+                logger.debug(f"{self.name} not cloned yet")
+            return
+
         try:
             self._repo = Repo(self.sourcedir)
-        except NoSuchPathError:
-            logger.debug(f"{self.name} not cloned yet")
-        except InvalidGitRepositoryError:
+        except (NoSuchPathError, InvalidGitRepositoryError):
             logger.warning(f"{self.name} not a git repository")
             # XXX: Fatal or rm and clone ?
 
@@ -104,7 +142,7 @@ class Git(ScmBaseClass):
         bool
             True if sha matches git SHA format, False otherwise
         """
-        return Repo.re_hexsha_only.match(sha) is not None
+        return _HEXSHA_RE.match(sha) is not None
 
     def is_valid_commit_sha(self, sha: str) -> bool:
         """Check that the given sha is a valid object.
@@ -119,7 +157,13 @@ class Git(ScmBaseClass):
         bool
             True id sha is well-formed and a valid git object (commit, tag, etc.)
         """
-        return self.is_hex_sha(sha) and self._repo.is_valid_object(sha)
+        if sha in self._valid_sha_cache:
+            return True
+
+        valid = self.is_hex_sha(sha) and self._repo.is_valid_object(sha)
+        if valid:
+            self._valid_sha_cache.add(sha)
+        return valid
 
     def _reset(self, revision: str, hard: bool = True) -> None:
         args: list[str] = list()
@@ -143,7 +187,8 @@ class Git(ScmBaseClass):
             self._repo = Repo.clone_from(
                 url=self.url,
                 to_path=self.sourcedir,
-                progress=GitProgressBar(),  # type: ignore
+                progress=GitProgressBar(self.name),  # type: ignore
+                multi_options=_CLONE_OPTIONS,
                 no_checkout=True,
             )
             self._checkout(self.revision)
@@ -151,7 +196,8 @@ class Git(ScmBaseClass):
             self._repo = Repo.clone_from(
                 url=self.url,
                 to_path=self.sourcedir,
-                progress=GitProgressBar(),  # type: ignore
+                progress=GitProgressBar(self.name),  # type: ignore
+                multi_options=_CLONE_OPTIONS,
                 branch=self.revision,
                 single_branch=True,
             )
@@ -173,7 +219,7 @@ class Git(ScmBaseClass):
             if is_new_ref:
                 refspec += ":" + refspec
 
-        fetch_infos = self._repo.remote().fetch(refspec=refspec, progress=GitProgressBar())
+        fetch_infos = self._repo.remote().fetch(refspec=refspec, progress=GitProgressBar(self.name))
 
         # this should never occurs
         if len(fetch_infos) != 1:
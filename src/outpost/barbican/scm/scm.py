@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
 
 
@@ -11,12 +12,15 @@ class ScmBaseClass(ABC):
         self._name = name
         self._src_dir = src_dir
         self._config = config
+        # uri and revision are mandatory in scm config (see config schema)
+        self._url: str = config["uri"]
+        self._revision: str = config["revision"]
 
     @property
     def project_sourcedir(self) -> Path:
         return self._src_dir
 
-    @property
+    @cached_property
     def sourcedir(self) -> Path:
         return self._src_dir / self.name
 
@@ -26,11 +30,11 @@ class ScmBaseClass(ABC):
 
     @property
     def url(self) -> str:
-        return self._config["uri"]
+        return self._url
 
     @property
     def revision(self) -> str:
-        return self._config["revision"]
+        return self._revision
 
     @abstractmethod
     def download(self) -> None: ...
@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
-import math
 
 from contextlib import contextmanager
 from enum import Enum
@@ -41,30 +40,15 @@ def working_directory(path: Path):
         os.chdir(prev)
 
 
-def working_directory_attr(attr):
-    """Change working dir for the decorated function.
-
-    Enter a new dir and leave after function call the directory is a property (attr) of an object.
-    """
-
-    def _working_directory(func):
-        def wrapper(self, *args, **kwargs):
-            with working_directory(Path(getattr(self, attr))):
-                return func(self, *args, **kwargs)
-
-        return wrapper
-
-    return _working_directory
-
-
 def pow2_round_up(x: int) -> int:
     """Round number to the next power of 2 boundary."""
-    return 1 if x == 0 else 2 ** math.ceil(math.log2(x))
+    return 1 if x <= 1 else 1 << (x - 1).bit_length()
 
 
 def pow2_greatest_divisor(x: int) -> int:
     """Return the highest power of 2 than can divide x."""
-    return math.gcd(x, pow2_round_up(x))
+    # Lowest set bit, 1 for 0 (as 2^0 divides any number)
+    return (x & -x) or 1
 
 
 def align_to(x: int, a: int) -> int:
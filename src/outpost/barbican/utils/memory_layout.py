@@ -6,13 +6,16 @@ from dataclasses import dataclass, fields, field, asdict
 from enum import unique, auto, IntFlag
 
 from enum import Enum
-import json
+import orjson
 from pathlib import Path
 import typing as T
 
 from . import StrEnum
 
 
+_ORJSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
+
 @dataclass(kw_only=True, frozen=True)
 class Region:
     @unique
@@ -63,13 +66,12 @@ class Region:
 
     def save(self, filepath: Path) -> None:
         data = asdict(self, dict_factory=self.dict_factory)
-        with filepath.open("w") as f:
-            json.dump(data, f, indent=4)
+        filepath.write_bytes(orjson.dumps(data, option=_ORJSON_DUMP_OPTIONS))
 
     @classmethod
     def load(cls, filepath: Path) -> "Region":
-        with filepath.resolve(strict=True).open("r") as f:
-            data = json.load(f)
+        with filepath.resolve(strict=True).open("rb") as f:
+            data = orjson.loads(f.read())
             return cls.from_dict(data)
 
 
@@ -87,7 +89,6 @@ class Layout:
 
     def save(self, filepath: Path) -> None:
         data = asdict(self, dict_factory=Region.dict_factory)
-        with filepath.open("w") as f:
-            json.dump(data, f, indent=4)
+        filepath.write_bytes(orjson.dumps(data, option=_ORJSON_DUMP_OPTIONS))
 
     # def load
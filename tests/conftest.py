@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import pytest
+
+from pathlib import Path
+
+from git import Repo
+from git.exc import GitCommandError
+
+# Unique file name generator (within a test session)
+_file_counter = itertools.count()
+
+
+def add_and_commit_random_file(repo: Repo) -> None:
+    file = Path(repo.working_tree_dir, f"f{next(_file_counter):016x}")
+    file.touch()
+    repo.index.add(file)
+    repo.index.commit(f"Adding {file.name}")
+
+
+def set_repo_default_user_config(repo: Repo) -> None:
+    name: str
+    email: str
+
+    with repo.config_reader(config_level="repository") as reader:
+        name = reader.get_value("user", "name", "CI Joe")
+        email = reader.get_value("user", "email", "ci.joe@ci.com")
+
+    with repo.config_writer(config_level="repository") as writer:
+        writer.set_value("user", "name", name)
+        writer.set_value("user", "email", email)
+
+
+@pytest.fixture(scope="session")
+def commit_files():
+    """Provide the helper adding and committing new files to a repository."""
+    return add_and_commit_random_file
+
+
+@pytest.fixture(scope="session")
+def private_dir(tmp_path_factory):
+    # Created once per session, no need for a numbered (unique) directory
+    return tmp_path_factory.mktemp("barbican", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def origin(private_dir):
+    origin_dir = private_dir / "origin"
+    # initialize empty git repository
+    origin_repo = Repo.init(origin_dir)
+    set_repo_default_user_config(origin_repo)
+    # No need for housekeeping nor durability in a short lived test repository
+    with origin_repo.config_writer(config_level="repository") as writer:
+        writer.set_value("gc", "auto", 0)
+        writer.set_value("core", "fsync", "none")
+    add_and_commit_random_file(origin_repo)
+    return origin_repo
+
+
+@pytest.fixture(scope="session")
+def default_branch(origin):
+    # master by default, until git v2.28, this is hardcoded.
+    # from git v2.28, this can be changed through `init.defaultBranch`
+    default_branch = "master"
+    major, minor, _ = origin.git.version_info
+    if major >= 2 and minor >= 28:
+        try:
+            default_branch = origin.git.config(["--global", "init.defaultBranch"])
+        except GitCommandError:
+            pass
+    return default_branch
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+
+import pytest
+from jsonschema import ValidationError
+
+from outpost.barbican import config
+
+_SCM = {"git": {"uri": "https://github.com/outpost-os/sentry-kernel.git", "revision": "main"}}
+
+_PROJECT = {
+    "name": "test project",
+    "version": "v0.0.1",
+    "dts": "dts/sample.dts",
+    "crossfile": "cm33-none-eabi-gcc.ini",
+    "kernel": {"scm": _SCM, "config": "configs/sentry/nucleo_u5a5.config"},
+    "runtime": {"scm": _SCM, "config": "configs/shield/shield.config"},
+    "application": {
+        "hello": {
+            "scm": _SCM,
+            "config": "configs/hello/hello.config",
+            "build": {"backend": "meson", "options": {"static_pie": False}},
+            "depends": [],
+            "provides": ["hello.elf"],
+        },
+    },
+}
+
+
+def test_validate():
+    config.validate(_PROJECT)
+    # validator is built once and reused
+    assert config._get_validator() is config._get_validator()
+
+
+@pytest.mark.parametrize(
+    "path,value",
+    [
+        (("name",), None),
+        (("kernel", "scm", "git", "revision"), None),
+        (("kernel", "pouette"), "pouette"),
+        (("application", "hello", "build", "backend"), "make"),
+        (("application", "hello", "build", "options", "opt"), 1.5),
+        (("license",), "Apache-2.0"),
+    ],
+)
+def test_validate_invalid(path, value):
+    project = copy.deepcopy(_PROJECT)
+    node = project
+    for key in path[:-1]:
+        node = node[key]
+    if value is None:
+        del node[path[-1]]
+    else:
+        node[path[-1]] = value
+
+    with pytest.raises(ValidationError):
+        config.validate(project)
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from outpost.barbican._internals import gen_ldscript
+
+
+@pytest.fixture
+def template(tmp_path):
+    template = tmp_path / "linkerscript.ld.in"
+    template.write_text(
+        "{{ name }}\n"
+        "{% for region in layout if region.name == name %}{{ region.addr }}{% endfor %}\n"
+    )
+    return template
+
+
+@pytest.fixture
+def layout(tmp_path):
+    layout = tmp_path / "layout.json"
+    layout.write_text(
+        json.dumps(
+            {
+                "regions": [
+                    {"name": "app1", "addr": "0x08010000"},
+                    {"name": "app2", "addr": "0x08020000"},
+                ]
+            }
+        )
+    )
+    return layout
+
+
+def test_gen_ldscripts(tmp_path, template, layout):
+    outputs = [tmp_path / "app1.lds", tmp_path / "app2.lds"]
+    gen_ldscript.run(
+        ["--name", "app1", "--name", "app2", str(template), str(layout)]
+        + [str(output) for output in outputs]
+    )
+    assert outputs[0].read_text() == "app1\n0x08010000"
+    assert outputs[1].read_text() == "app2\n0x08020000"
+
+
+def test_gen_ldscripts_count_mismatch(tmp_path, template, layout):
+    output = tmp_path / "app1.lds"
+    with pytest.raises(SystemExit):
+        gen_ldscript.run(
+            ["--name", "app1", "--name", "app2", str(template), str(layout), str(output)]
+        )
+    assert not output.exists()
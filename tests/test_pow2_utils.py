@@ -33,8 +33,7 @@ def test_pow2_round_up():
         48547: 65536,
     }
 
-    for value, expected in _test_set.items():
-        assert pow2_round_up(value) == expected
+    assert list(map(pow2_round_up, _test_set.keys())) == list(_test_set.values())
 
 
 def test_pow2_greatest_divisor():
@@ -49,5 +48,4 @@ def test_pow2_greatest_divisor():
         4 * 1024: 4 * 1024,
     }
 
-    for value, expected in _test_set.items():
-        assert pow2_greatest_divisor(value) == expected
+    assert list(map(pow2_greatest_divisor, _test_set.keys())) == list(_test_set.values())